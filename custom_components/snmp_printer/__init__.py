@@ -4,8 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import re
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
@@ -14,7 +19,15 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import (
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    MAX_CONCURRENT_SNMP_REQUESTS,
+    MAX_CONCURRENT_SNMP_REQUESTS_PER_PRINTER,
+    WEB_INTERFACE_CHECK_INTERVAL,
+    WEB_INTERFACE_GRACE_PERIOD,
+)
 from .snmp_client import SNMPClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,44 +35,184 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 STORAGE_VERSION = 1
 STORAGE_KEY = "snmp_printer_cached_data"
+STORAGE_SAVE_DELAY = 300  # Persist cached data at most every 5 minutes
+DATA_SEMAPHORE = "semaphore"
+
+# Substrings of the system description identifying the manufacturer
+_MANUFACTURERS = {
+    "HP": "HP",
+    "Hewlett-Packard": "HP",
+    "Canon": "Canon",
+    "Epson": "Epson",
+    "Brother": "Brother",
+    "Lexmark": "Lexmark",
+    "Samsung": "Samsung",
+    "Xerox": "Xerox",
+}
+_MANUFACTURER_RE = re.compile("|".join(re.escape(sub) for sub in _MANUFACTURERS))
+
+# Error messages of SNMP library exceptions that indicate an unreachable printer
+_CONNECTION_ERROR_RE = re.compile(
+    r"timeout|unreachable|no route|connection|network|host|refused|failed"
+    r"|no response",
+    re.IGNORECASE,
+)
+
+
+async def _async_probe_url(session: aiohttp.ClientSession, url: str) -> bool:
+    """Check if a URL is served by the printer."""
+    async with asyncio.timeout(3):
+        # HEAD avoids downloading the page body
+        async with session.head(url, allow_redirects=False) as response:
+            if response.status not in (405, 501):
+                # Any response below 500 means web interface exists
+                return response.status < 500
+
+        # HEAD is not supported, fetch as little of the page as possible
+        async with session.get(
+            url, allow_redirects=False, headers={"Range": "bytes=0-0"}
+        ) as response:
+            return response.status < 500
 
 
 async def check_web_interface(host: str, hass: HomeAssistant) -> bool:
     """Check if the printer has a web interface available."""
-    session = async_get_clientsession(hass)
-
     # Try HTTP first
     try:
-        async with asyncio.timeout(3):
-            async with session.get(f"http://{host}", allow_redirects=True) as response:
-                if (
-                    response.status < 500
-                ):  # Any response below 500 means web interface exists
-                    return True
+        if await _async_probe_url(async_get_clientsession(hass), f"http://{host}"):
+            return True
     except Exception:
         pass
 
-    # Try HTTPS
+    # Try HTTPS, printers usually have self-signed certificates
     try:
-        async with asyncio.timeout(3):
-            async with session.get(
-                f"https://{host}", allow_redirects=True, ssl=False
-            ) as response:
-                if response.status < 500:
-                    return True
+        if await _async_probe_url(
+            async_get_clientsession(hass, verify_ssl=False), f"https://{host}"
+        ):
+            return True
     except Exception:
         pass
 
     return False
 
 
+async def _async_limited(
+    printer_semaphore: asyncio.Semaphore,
+    shared_semaphore: asyncio.Semaphore,
+    request: Callable[[], Awaitable[Any]],
+    timeout: float | None = None,
+) -> Any:
+    """Run an SNMP request once the concurrency limits allow it.
+
+    The printer's own limit is taken first, so a printer never holds more
+    shared slots than that. The timeout only starts once the request may run,
+    so time spent waiting for other requests or printers does not count.
+    """
+    async with printer_semaphore, shared_semaphore:
+        try:
+            return await asyncio.wait_for(request(), timeout)
+        except TimeoutError as err:
+            raise TimeoutError(
+                f"{request.__name__} timed out after {timeout} seconds"
+            ) from err
+
+
+def _with_derived_data(data: dict[str, Any], host: str) -> dict[str, Any]:
+    """Return a copy of the printer data with lookup tables and device info.
+
+    The derived keys are rebuilt on every update and not persisted in the cache.
+    """
+    derived = dict(data)
+    derived["supplies_by_index"] = {
+        supply["index"]: supply for supply in data.get("supplies") or []
+    }
+    derived["input_trays_by_index"] = {
+        tray["index"]: tray for tray in data.get("input_trays") or []
+    }
+    derived["parsed_device_info"] = _parse_device_info(data, host)
+    return derived
+
+
+def _printer_info(
+    system_info: dict[str, Any], device_info: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the printer information fields of the coordinator data."""
+    return {
+        "description": system_info.get("description"),
+        "name": system_info.get("name"),
+        "contact": system_info.get("contact"),
+        "location": system_info.get("location"),
+        "uptime": system_info.get("uptime"),
+        "state": device_info.get("state", "unknown"),
+        "serial_number": device_info.get("serial_number"),
+        "mac_address": device_info.get("mac_address"),
+        "memory_size": device_info.get("memory_size"),
+        "page_count": device_info.get(
+            "page_counts", {"total": device_info.get("page_count")}
+        ),
+    }
+
+
+def _migrate_cached_data(data: dict[str, Any]) -> dict[str, Any]:
+    """Convert cached data stored with the previous nested layout."""
+    if "info" not in data:
+        return data
+
+    info = data.pop("info")
+    data.pop("status", None)
+    data.update(_printer_info(info, info))
+    data["cover_state"] = data.pop("cover_status", {}).get("state", "unknown")
+    return data
+
+
+def _parse_device_info(data: dict[str, Any], host: str) -> dict[str, Any]:
+    """Extract device registry information from printer data."""
+    # Extract manufacturer and model from description
+    description = data.get("description") or ""
+    location = data.get("location") or ""
+
+    # Try to get model name from description PID field
+    model = "Unknown Printer"
+    if "PID:" in description:
+        model = description.split("PID:")[1].split(",")[0].split(";")[0].strip()
+    elif location:
+        model = location
+
+    # Find any known manufacturer in a single pass over the description
+    match = _MANUFACTURER_RE.search(description)
+    manufacturer = _MANUFACTURERS[match.group()] if match else "Unknown"
+
+    device_info = {
+        "name": model if model != "Unknown Printer" else host,
+        "manufacturer": manufacturer,
+        "model": model,
+    }
+
+    # Add configuration URL if web interface is available
+    if data.get("web_interface_available"):
+        device_info["configuration_url"] = f"http://{host}"
+
+    if data.get("serial_number"):
+        device_info["serial_number"] = data["serial_number"]
+
+    return device_info
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SNMP Printer from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    host = entry.data[CONF_HOST]
+
+    # Bound SNMP traffic from this printer and from all printers polling at
+    # the same time
+    printer_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SNMP_REQUESTS_PER_PRINTER)
+    shared_semaphore = hass.data[DOMAIN].setdefault(
+        DATA_SEMAPHORE, asyncio.Semaphore(MAX_CONCURRENT_SNMP_REQUESTS)
+    )
 
     # Create SNMP client
     snmp_client = SNMPClient(
-        host=entry.data[CONF_HOST],
+        host=host,
         port=entry.data.get("port", 161),
         snmp_version=entry.data.get("snmp_version", "2c"),
         community=entry.data.get("community", "public"),
@@ -72,7 +225,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Verify connection
     try:
-        await snmp_client.get_system_info()
+        await _async_limited(
+            printer_semaphore, shared_semaphore, snmp_client.get_system_info
+        )
     except Exception as err:
         raise ConfigEntryNotReady(f"Unable to connect to printer: {err}") from err
 
@@ -82,74 +237,171 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
     )
 
+    # Leave some room before the next poll is due
+    request_timeout = max(update_interval - 2, 5)
+
     # Create storage for cached data
     store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
 
     # Load cached data
     cached_data = await store.async_load() or {}
+    if cached_data.get("data"):
+        _migrate_cached_data(cached_data["data"])
+    cached_data["host"] = host
+    save_pending = False
+    last_success: float | None = None  # Monotonic time of the last update
+
+    def _refresh_cache_timestamp() -> None:
+        """Store the time of the last successful update in the cached data."""
+        nonlocal last_success
+
+        if last_success is not None:
+            # Only format when needed, counting back the elapsed monotonic
+            # time so wall clock adjustments since the update don't matter
+            elapsed = timedelta(seconds=time.monotonic() - last_success)
+            cached_data["timestamp"] = (datetime.now(timezone.utc) - elapsed).isoformat(
+                timespec="seconds"
+            )
+            last_success = None
+
+    def _cached_data_to_save() -> dict[str, Any]:
+        """Return the cached data when the delayed save is written."""
+        nonlocal save_pending
+        save_pending = False
+        _refresh_cache_timestamp()
+        return cached_data
+
+    # Web interface availability rarely changes, so only probe it periodically
+    web_probe_cache: dict[str, Any] = {}
+
+    async def async_check_web_interface() -> bool:
+        """Return web interface availability, probing at most once per interval."""
+        now = time.monotonic()
+        if (
+            web_probe_cache
+            and now - web_probe_cache["ts"] < WEB_INTERFACE_CHECK_INTERVAL
+        ):
+            return web_probe_cache["value"]
+
+        value = await check_web_interface(host, hass)
+        if value:
+            web_probe_cache["last_seen"] = now
+        elif (
+            web_probe_cache.get("value")
+            and now - web_probe_cache["last_seen"] < WEB_INTERFACE_GRACE_PERIOD
+        ):
+            # Don't drop the configuration URL over a transient failure
+            _LOGGER.debug(
+                "Web interface of %s did not respond, keeping last known state",
+                host,
+            )
+            value = True
+
+        web_probe_cache["value"] = value
+        web_probe_cache["ts"] = now
+        return value
 
     # Create coordinator
     async def async_update_data():
         """Fetch data from SNMP printer."""
+        nonlocal save_pending, last_success
+
         try:
-            system_info = await snmp_client.get_system_info()
-            device_info = await snmp_client.get_device_info()
-            data = {
-                "info": {**system_info, **device_info},
-                "status": device_info,
-                "cover_status": {"state": await snmp_client.get_cover_status()},
-                "page_count": device_info.get(
-                    "page_counts", {"total": device_info.get("page_count")}
-                ),
-                "supplies": await snmp_client.get_supplies(),
-                "input_trays": await snmp_client.get_input_trays(),
-                "display_text": await snmp_client.get_display_text(),
-                "errors": await snmp_client.get_printer_errors(),
-                "web_interface_available": await check_web_interface(
-                    entry.data[CONF_HOST], hass
-                ),
-            }
-
-            # Save successful data to cache with timestamp
-            cache_data = {
-                "data": data,
-                "timestamp": datetime.now().isoformat(),
-                "host": entry.data[CONF_HOST],
-            }
-            await store.async_save(cache_data)
+            # The SNMP requests are independent round-trips to the same host,
+            # so issue them concurrently. Each one is bounded on its own, so a
+            # single slow OID only falls back to its last known value.
+            def _fetch(request: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+                """Run an SNMP request within the concurrency and time limits."""
+                return _async_limited(
+                    printer_semaphore, shared_semaphore, request, request_timeout
+                )
+
+            (
+                system_info,
+                device_info,
+                cover_status,
+                supplies,
+                input_trays,
+                display_text,
+                errors,
+                web_interface_available,
+            ) = await asyncio.gather(
+                _fetch(snmp_client.get_system_info),
+                _fetch(snmp_client.get_device_info),
+                _fetch(snmp_client.get_cover_status),
+                _fetch(snmp_client.get_supplies),
+                _fetch(snmp_client.get_input_trays),
+                _fetch(snmp_client.get_display_text),
+                _fetch(snmp_client.get_printer_errors),
+                async_check_web_interface(),
+                return_exceptions=True,
+            )
+
+            # Without system and device info there is nothing to show
+            for result in (system_info, device_info):
+                if isinstance(result, Exception):
+                    raise result
+
+            # For the remaining fields, fall back to the last known value
+            previous = cached_data.get("data") or {}
+
+            def _result_or_previous(result: Any, key: str, default: Any) -> Any:
+                """Return the fetched value, or the last known one on failure."""
+                if isinstance(result, Exception):
+                    _LOGGER.debug(
+                        "Failed to fetch %s from %s: %s",
+                        key,
+                        host,
+                        result,
+                    )
+                    return previous.get(key, default)
+                return result
+
+            data = _printer_info(system_info, device_info)
+            data["cover_state"] = _result_or_previous(
+                cover_status, "cover_state", "unknown"
+            )
+            data["supplies"] = _result_or_previous(supplies, "supplies", [])
+            data["input_trays"] = _result_or_previous(input_trays, "input_trays", [])
+            data["display_text"] = _result_or_previous(
+                display_text, "display_text", None
+            )
+            data["errors"] = _result_or_previous(errors, "errors", None)
+            data["web_interface_available"] = _result_or_previous(
+                web_interface_available, "web_interface_available", False
+            )
+
+            # Keep successful data in memory with timestamp for offline use,
+            # and coalesce writes to disk instead of saving on every poll
+            cached_data["data"] = data
+            last_success = time.monotonic()
+            if not save_pending:
+                save_pending = True
+                store.async_delay_save(_cached_data_to_save, STORAGE_SAVE_DELAY)
+
+            printer_data = _with_derived_data(data, host)
 
             # Mark as online
-            data["is_online"] = True
+            printer_data["is_online"] = True
 
-            return data
+            return printer_data
         except Exception as err:
             # Check if this is a connection-related error
-            error_msg = str(err).lower()
-            is_connection_error = any(
-                keyword in error_msg
-                for keyword in [
-                    "timeout",
-                    "unreachable",
-                    "no route",
-                    "connection",
-                    "network",
-                    "host",
-                    "refused",
-                    "failed",
-                    "no response",
-                ]
+            is_connection_error = isinstance(err, (TimeoutError, OSError)) or bool(
+                _CONNECTION_ERROR_RE.search(str(err))
             )
 
             # If we have cached data and this is a connection issue, return cached data
             if cached_data.get("data") and is_connection_error:
+                _refresh_cache_timestamp()
                 _LOGGER.warning(
                     "Printer %s is offline (%s), using cached data from %s",
-                    entry.data[CONF_HOST],
+                    host,
                     err,
                     cached_data.get("timestamp", "unknown"),
                 )
 
-                cached_printer_data = cached_data["data"].copy()
+                cached_printer_data = _with_derived_data(cached_data["data"], host)
                 cached_printer_data["is_online"] = False
                 cached_printer_data["offline_since"] = cached_data.get("timestamp")
 
@@ -161,9 +413,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
-        name=f"snmp_printer_{entry.data[CONF_HOST]}",
+        name=f"snmp_printer_{host}",
         update_method=async_update_data,
         update_interval=timedelta(seconds=update_interval),
+        # Only notify the sensors when the printer data actually changed
+        always_update=False,
     )
 
     # Fetch initial data
@@ -174,6 +428,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "coordinator": coordinator,
         "client": snmp_client,
         "store": store,
+        "web_probe_cache": web_probe_cache,
     }
 
     # Forward entry setup to platforms
@@ -25,6 +25,17 @@ DEFAULT_ERROR_LOG_INTERVAL: Final = (
     300  # Log offline errors at most once every 5 minutes
 )
 
+# Maximum number of SNMP requests in flight across all printers, and per printer
+# so a few unresponsive printers can't hold all shared slots
+MAX_CONCURRENT_SNMP_REQUESTS: Final = 16
+MAX_CONCURRENT_SNMP_REQUESTS_PER_PRINTER: Final = 3
+
+# Web interface detection
+WEB_INTERFACE_CHECK_INTERVAL: Final = 3600  # Re-probe the web interface hourly
+WEB_INTERFACE_GRACE_PERIOD: Final = (
+    10800  # Keep reporting a web interface for 3 hours after it stops answering
+)
+
 # SNMP OIDs based on RFC 3805 (Printer MIB) and RFC 1213 (MIB-II)
 # System information
 OID_SYSTEM_DESCRIPTION: Final = "1.3.6.1.2.1.1.1.0"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from datetime import datetime
 from typing import Any
 
@@ -25,6 +26,32 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of a standard tray in its name (e.g. "Tray 2")
+_TRAY_NUM_RE = re.compile(r"\d+")
+
+# Printer information exposed as status sensor attributes
+_STATUS_ATTRIBUTES = ("uptime", "contact", "location", "serial_number", "description")
+
+# RGB color codes of ink/toner supplies for UI customization
+_RGB_BY_COLOR = {
+    "Black": (0, 0, 0),
+    "Cyan": (0, 255, 255),
+    "Magenta": (255, 0, 255),
+    "Yellow": (255, 255, 0),
+    "Gray": (128, 128, 128),
+    "Grey": (128, 128, 128),
+    "Light Cyan": (128, 255, 255),
+    "Light Magenta": (255, 128, 255),
+    "Photo": (128, 128, 255),
+}
+
+
+def _get_device_unique_id(
+    coordinator: DataUpdateCoordinator, entry: ConfigEntry
+) -> str:
+    """Return the unique ID of the printer: its serial number, or the host."""
+    return (coordinator.data or {}).get("serial_number", entry.data[CONF_HOST])
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,32 +61,28 @@ async def async_setup_entry(
     """Set up SNMP Printer sensors based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
-    entities = []
-
-    # Add main status sensor
-    entities.append(PrinterStatusSensor(coordinator, entry))
-
-    # Add cover status sensor
-    entities.append(PrinterCoverStatusSensor(coordinator, entry))
-
-    # Add page count sensor
-    entities.append(PrinterPageCountSensor(coordinator, entry))
+    data = coordinator.data or {}
 
-    # Add error sensor
-    entities.append(PrinterErrorSensor(coordinator, entry))
-
-    # Add display text sensor
-    entities.append(PrinterDisplayTextSensor(coordinator, entry))
+    # Add status, cover, page count, error and display text sensors
+    entities = [
+        PrinterStatusSensor(coordinator, entry),
+        PrinterCoverStatusSensor(coordinator, entry),
+        PrinterPageCountSensor(coordinator, entry),
+        PrinterErrorSensor(coordinator, entry),
+        PrinterDisplayTextSensor(coordinator, entry),
+    ]
 
     # Add supply sensors (toner, ink, drums, etc.)
-    if coordinator.data and "supplies" in coordinator.data:
-        for supply in coordinator.data["supplies"]:
-            entities.append(PrinterSupplySensor(coordinator, entry, supply))
+    entities.extend(
+        PrinterSupplySensor(coordinator, entry, supply)
+        for supply in data.get("supplies", [])
+    )
 
     # Add tray sensors
-    if coordinator.data and "input_trays" in coordinator.data:
-        for tray in coordinator.data["input_trays"]:
-            entities.append(PrinterTraySensor(coordinator, entry, tray))
+    entities.extend(
+        PrinterTraySensor(coordinator, entry, tray)
+        for tray in data.get("input_trays", [])
+    )
 
     async_add_entities(entities, True)
 
@@ -67,6 +90,8 @@ async def async_setup_entry(
 class PrinterSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for printer sensors."""
 
+    __slots__ = ("_entry", "_device_unique_id")
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -75,6 +100,7 @@ class PrinterSensorBase(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry = entry
+        self._device_unique_id = _get_device_unique_id(coordinator, entry)
         self._attr_has_entity_name = True
 
     @property
@@ -93,63 +119,18 @@ class PrinterSensorBase(CoordinatorEntity, SensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        data = self.coordinator.data
-        info = data.get("info", {})
-        status = data.get("status", {})
-
-        # Extract manufacturer and model from description
-        description = info.get("description", "")
-        location = info.get("location", "")
-
-        # Try to get model name from description PID field
-        model = "Unknown Printer"
-        if "PID:" in description:
-            parts = description.split("PID:")
-            if len(parts) > 1:
-                model = parts[1].split(",")[0].split(";")[0].strip()
-        elif location:
-            model = location
-
-        # Extract manufacturer
-        manufacturer = "Unknown"
-        if "HP" in description or "Hewlett-Packard" in description:
-            manufacturer = "HP"
-        elif "Canon" in description:
-            manufacturer = "Canon"
-        elif "Epson" in description:
-            manufacturer = "Epson"
-        elif "Brother" in description:
-            manufacturer = "Brother"
-        elif "Lexmark" in description:
-            manufacturer = "Lexmark"
-        elif "Samsung" in description:
-            manufacturer = "Samsung"
-        elif "Xerox" in description:
-            manufacturer = "Xerox"
-
-        # Use serial number or host as unique ID
-        unique_id = info.get("serial_number", self._entry.data[CONF_HOST])
-
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, unique_id)},
-            name=model if model != "Unknown Printer" else self._entry.data[CONF_HOST],
-            manufacturer=manufacturer,
-            model=model,
+        # Manufacturer, model etc. are parsed once per update by the coordinator
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device_unique_id)},
+            **self.coordinator.data.get("parsed_device_info", {}),
         )
 
-        # Add configuration URL if web interface is available
-        if data.get("web_interface_available"):
-            device_info["configuration_url"] = f"http://{self._entry.data[CONF_HOST]}"
-
-        if info.get("serial_number"):
-            device_info["serial_number"] = info["serial_number"]
-
-        return device_info
-
 
 class PrinterStatusSensor(PrinterSensorBase):
     """Representation of a printer status sensor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -158,10 +139,7 @@ class PrinterStatusSensor(PrinterSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_translation_key = "status"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_status"
+        self._attr_unique_id = f"{self._device_unique_id}_status"
         self._attr_icon = "mdi:printer"
         self._attr_device_class = SensorDeviceClass.ENUM
         self._attr_options = ["idle", "printing", "warming_up", "offline", "unknown"]
@@ -176,8 +154,7 @@ class PrinterStatusSensor(PrinterSensorBase):
         if not self.is_printer_online:
             return "offline"
 
-        status = self.coordinator.data.get("status", {})
-        return status.get("state", "unknown")
+        return self.coordinator.data.get("state", "unknown")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -185,16 +162,13 @@ class PrinterStatusSensor(PrinterSensorBase):
         if not self.coordinator.data:
             return {}
 
-        info = self.coordinator.data.get("info", {})
-        status = self.coordinator.data.get("status", {})
-
-        attributes = {
-            "uptime": info.get("uptime"),
-            "contact": info.get("contact"),
-            "location": info.get("location"),
-            "serial_number": info.get("serial_number"),
-            "description": info.get("description"),
-        }
+        data = self.coordinator.data
+        attributes = {}
+        for key in _STATUS_ATTRIBUTES:
+            # Skip values the printer doesn't report
+            value = data.get(key)
+            if value is not None:
+                attributes[key] = value
 
         # Add offline information if using cached data
         if not self.is_printer_online:
@@ -203,13 +177,14 @@ class PrinterStatusSensor(PrinterSensorBase):
             if offline_since:
                 attributes["offline_since"] = offline_since
 
-        # Remove None values
-        return {k: v for k, v in attributes.items() if v is not None}
+        return attributes
 
 
 class PrinterCoverStatusSensor(PrinterSensorBase):
     """Representation of a printer cover status sensor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -218,10 +193,7 @@ class PrinterCoverStatusSensor(PrinterSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_translation_key = "cover_status"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_cover_status"
+        self._attr_unique_id = f"{self._device_unique_id}_cover_status"
         self._attr_icon = "mdi:printer-3d-nozzle-alert"
 
     @property
@@ -230,8 +202,7 @@ class PrinterCoverStatusSensor(PrinterSensorBase):
         # Disable by default if no cover data or state is unknown
         if not self.coordinator.data:
             return False
-        cover_status = self.coordinator.data.get("cover_status", {})
-        state = cover_status.get("state", "unknown")
+        state = self.coordinator.data.get("cover_state", "unknown")
         # Enable only if we have a valid state (not unknown)
         return state != "unknown" and state != ""
 
@@ -241,13 +212,14 @@ class PrinterCoverStatusSensor(PrinterSensorBase):
         if not self.coordinator.data:
             return "unknown"
 
-        cover_status = self.coordinator.data.get("cover_status", {})
-        return cover_status.get("state", "unknown")
+        return self.coordinator.data.get("cover_state", "unknown")
 
 
 class PrinterPageCountSensor(PrinterSensorBase):
     """Representation of a printer page count sensor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -256,10 +228,7 @@ class PrinterPageCountSensor(PrinterSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_translation_key = "page_count"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_page_count"
+        self._attr_unique_id = f"{self._device_unique_id}_page_count"
         self._attr_icon = "mdi:counter"
         self._attr_native_unit_of_measurement = "pages"
 
@@ -281,11 +250,13 @@ class PrinterPageCountSensor(PrinterSensorBase):
         page_count = self.coordinator.data.get("page_count", {})
         attrs = {}
 
-        if page_count.get("color") is not None:
-            attrs["color_pages"] = page_count.get("color")
+        color_pages = page_count.get("color")
+        if color_pages is not None:
+            attrs["color_pages"] = color_pages
 
-        if page_count.get("black_and_white") is not None:
-            attrs["black_and_white_pages"] = page_count.get("black_and_white")
+        black_and_white_pages = page_count.get("black_and_white")
+        if black_and_white_pages is not None:
+            attrs["black_and_white_pages"] = black_and_white_pages
 
         # Add offline information if using cached data
         if not self.is_printer_online:
@@ -300,6 +271,8 @@ class PrinterPageCountSensor(PrinterSensorBase):
 class PrinterSupplySensor(PrinterSensorBase):
     """Representation of a printer supply sensor."""
 
+    __slots__ = ("_supply",)
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -319,25 +292,12 @@ class PrinterSupplySensor(PrinterSensorBase):
             # Fallback to description for non-standard supplies
             self._attr_name = supply.get("description", "Supply")
 
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_supply_{supply.get('index')}"
+        self._attr_unique_id = f"{self._device_unique_id}_supply_{supply.get('index')}"
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
         # Set icon based on color - use droplets for all ink/toner
-        if color in [
-            "Black",
-            "Cyan",
-            "Magenta",
-            "Yellow",
-            "Gray",
-            "Grey",
-            "Light Cyan",
-            "Light Magenta",
-            "Photo",
-        ]:
+        if color in _RGB_BY_COLOR:
             self._attr_icon = "mdi:water"
         else:
             # For unknown colors, check supply type
@@ -360,63 +320,51 @@ class PrinterSupplySensor(PrinterSensorBase):
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
         # Update supply data from coordinator
-        if not self.coordinator.data or "supplies" not in self.coordinator.data:
-            return None
-
-        for supply in self.coordinator.data["supplies"]:
-            if supply.get("index") == self._supply.get("index"):
-                return supply.get("percentage")
+        supply = self._current_supply
+        return supply.get("percentage") if supply else None
 
-        return None
+    @property
+    def _current_supply(self) -> dict[str, Any] | None:
+        """Return the latest data for this supply from the coordinator."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get("supplies_by_index", {}).get(
+            self._supply.get("index")
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data or "supplies" not in self.coordinator.data:
+        supply = self._current_supply
+        if not supply:
             return {}
 
-        for supply in self.coordinator.data["supplies"]:
-            if supply.get("index") == self._supply.get("index"):
-                attributes = {
-                    "type": supply.get("type"),
-                    "color": supply.get("color"),
-                    "description": supply.get("description"),
-                }
-
-                # Add offline information if using cached data
-                if not self.is_printer_online:
-                    attributes["using_cached_data"] = True
-                    offline_since = self.coordinator.data.get("offline_since")
-                    if offline_since:
-                        attributes["last_updated"] = offline_since
-
-                # Add RGB color code for UI customization
-                color = supply.get("color", "")
-                if color == "Black":
-                    attributes["rgb_color"] = [0, 0, 0]
-                elif color == "Cyan":
-                    attributes["rgb_color"] = [0, 255, 255]
-                elif color == "Magenta":
-                    attributes["rgb_color"] = [255, 0, 255]
-                elif color == "Yellow":
-                    attributes["rgb_color"] = [255, 255, 0]
-                elif color == "Gray" or color == "Grey":
-                    attributes["rgb_color"] = [128, 128, 128]
-                elif color == "Light Cyan":
-                    attributes["rgb_color"] = [128, 255, 255]
-                elif color == "Light Magenta":
-                    attributes["rgb_color"] = [255, 128, 255]
-                elif color == "Photo":
-                    attributes["rgb_color"] = [128, 128, 255]
-
-                return attributes
-
-        return {}
+        attributes = {
+            "type": supply.get("type"),
+            "color": supply.get("color"),
+            "description": supply.get("description"),
+        }
+
+        # Add offline information if using cached data
+        if not self.is_printer_online:
+            attributes["using_cached_data"] = True
+            offline_since = self.coordinator.data.get("offline_since")
+            if offline_since:
+                attributes["last_updated"] = offline_since
+
+        # Add RGB color code for UI customization
+        rgb_color = _RGB_BY_COLOR.get(supply.get("color", ""))
+        if rgb_color is not None:
+            attributes["rgb_color"] = rgb_color
+
+        return attributes
 
 
 class PrinterTraySensor(PrinterSensorBase):
     """Representation of a printer tray sensor."""
 
+    __slots__ = ("_tray",)
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -432,19 +380,14 @@ class PrinterTraySensor(PrinterSensorBase):
         tray_name = description if description else f"Tray {tray.get('index', '')}"
 
         # Set translation key for standard trays (tray_1, tray_2, etc.)
-        if "Tray" in tray_name and any(char.isdigit() for char in tray_name):
-            # Extract number from tray name
-            tray_num = "".join(filter(str.isdigit, tray_name))
-            if tray_num:
-                self._attr_translation_key = f"tray_{tray_num}"
+        tray_num = _TRAY_NUM_RE.search(tray_name) if "Tray" in tray_name else None
+        if tray_num:
+            self._attr_translation_key = f"tray_{tray_num.group()}"
         else:
             # For non-standard trays (e.g., "MP Tray"), use explicit name
             self._attr_name = tray_name
 
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_tray_{tray.get('index')}"
+        self._attr_unique_id = f"{self._device_unique_id}_tray_{tray.get('index')}"
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_icon = "mdi:tray"
         self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -460,45 +403,47 @@ class PrinterTraySensor(PrinterSensorBase):
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
         # Update tray data from coordinator
-        if not self.coordinator.data or "input_trays" not in self.coordinator.data:
-            return None
+        tray = self._current_tray
+        return tray.get("percentage") if tray else None
 
-        for tray in self.coordinator.data["input_trays"]:
-            if tray.get("index") == self._tray.get("index"):
-                return tray.get("percentage")
-
-        return None
+    @property
+    def _current_tray(self) -> dict[str, Any] | None:
+        """Return the latest data for this tray from the coordinator."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get("input_trays_by_index", {}).get(
+            self._tray.get("index")
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        if not self.coordinator.data or "input_trays" not in self.coordinator.data:
+        tray = self._current_tray
+        if not tray:
             return {}
 
-        for tray in self.coordinator.data["input_trays"]:
-            if tray.get("index") == self._tray.get("index"):
-                attributes = {
-                    "status": tray.get("status"),
-                    "media_name": tray.get("media_name"),
-                    "max_capacity": tray.get("max_capacity"),
-                    "current_level": tray.get("current_level"),
-                }
-
-                # Add offline information if using cached data
-                if not self.is_printer_online:
-                    attributes["using_cached_data"] = True
-                    offline_since = self.coordinator.data.get("offline_since")
-                    if offline_since:
-                        attributes["last_updated"] = offline_since
+        attributes = {
+            "status": tray.get("status"),
+            "media_name": tray.get("media_name"),
+            "max_capacity": tray.get("max_capacity"),
+            "current_level": tray.get("current_level"),
+        }
 
-                return attributes
+        # Add offline information if using cached data
+        if not self.is_printer_online:
+            attributes["using_cached_data"] = True
+            offline_since = self.coordinator.data.get("offline_since")
+            if offline_since:
+                attributes["last_updated"] = offline_since
 
-        return {}
+        return attributes
 
 
 class PrinterErrorSensor(PrinterSensorBase):
     """Representation of a printer error sensor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -507,10 +452,7 @@ class PrinterErrorSensor(PrinterSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_translation_key = "errors"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_errors"
+        self._attr_unique_id = f"{self._device_unique_id}_errors"
         self._attr_icon = "mdi:alert"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
@@ -533,6 +475,8 @@ class PrinterErrorSensor(PrinterSensorBase):
 class PrinterDisplayTextSensor(PrinterSensorBase):
     """Representation of a printer display text sensor."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -541,10 +485,7 @@ class PrinterDisplayTextSensor(PrinterSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_translation_key = "display"
-        unique_id = self.coordinator.data.get("info", {}).get(
-            "serial_number", entry.data[CONF_HOST]
-        )
-        self._attr_unique_id = f"{unique_id}_display"
+        self._attr_unique_id = f"{self._device_unique_id}_display"
         self._attr_icon = "mdi:text-box"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 